@@ -3,8 +3,11 @@ import unittest
 from types import AsyncGeneratorType, GeneratorType
 from unittest.mock import MagicMock, patch
 
+from pydantic import ValidationError
+
 from unify.types import Prompt
 from unify import AsyncUnify, Unify
+from unify.chat.clients import uni_llm
 
 
 class TestChatBasics(unittest.TestCase):
@@ -125,5 +128,153 @@ class TestAsyncUnifyBasics(unittest.IsolatedAsyncioTestCase):
         self.assertIs(client.n, None)
 
 
+@patch.object(uni_llm, "_SKIP_VALIDATION", True)
+class TestDefaultPrompt(unittest.TestCase):
+    endpoint = "llama-3-8b-chat@together-ai"
+
+    def test_matches_prompt_built_from_set_fields(self) -> None:
+        client = Unify(api_key="not-a-real-key", endpoint=self.endpoint)
+        self.assertEqual(
+            client.default_prompt,
+            Prompt(max_completion_tokens=1024, temperature=1.0),
+        )
+
+    def test_empty_containers_are_left_out(self) -> None:
+        client = Unify(
+            api_key="not-a-real-key", endpoint=self.endpoint, messages=[],
+            temperature=0,
+        )
+        self.assertEqual(
+            client.default_prompt,
+            Prompt(max_completion_tokens=1024, temperature=0.0),
+        )
+        self.assertIsNone(client.default_prompt.messages)
+        self.assertIsNone(client.default_prompt.extra_body)
+
+    def test_invalid_value_raises(self) -> None:
+        client = Unify(
+            api_key="not-a-real-key", endpoint=self.endpoint, temperature="hot",
+        )
+        with self.assertRaises(ValidationError):
+            client.default_prompt
+
+    def test_reused_until_a_setter_is_called(self) -> None:
+        client = Unify(api_key="not-a-real-key", endpoint=self.endpoint)
+        client.default_prompt
+        cached = client._default_prompt
+        client.default_prompt
+        self.assertIs(client._default_prompt, cached)
+        client.set_temperature(0.3)
+        self.assertIsNone(client._default_prompt)
+        self.assertEqual(client.default_prompt.temperature, 0.3)
+
+    def test_every_prompt_setter_resets_the_cache(self) -> None:
+        values = {
+            "messages": [{"role": "user", "content": "hello"}],
+            "frequency_penalty": 0.5,
+            "logit_bias": {"1": 2},
+            "logprobs": True,
+            "top_logprobs": 2,
+            "max_completion_tokens": 7,
+            "n": 2,
+            "presence_penalty": 0.5,
+            "response_format": {"type": "json_object"},
+            "seed": 3,
+            "stop": "stop",
+            "temperature": 0.3,
+            "top_p": 0.5,
+            "tools": [{"type": "function", "function": {"name": "f"}}],
+            "tool_choice": "auto",
+            "parallel_tool_calls": False,
+            "extra_headers": {"header": "value"},
+            "extra_query": {"query": "value"},
+            "extra_body": {"body": "value"},
+        }
+        client = Unify(api_key="not-a-real-key", endpoint=self.endpoint)
+        for field, value in values.items():
+            with self.subTest(field=field):
+                client.default_prompt
+                getattr(client, "set_" + field)(value)
+                self.assertEqual(getattr(client.default_prompt, field), value)
+
+    def test_returned_prompt_is_a_copy(self) -> None:
+        client = Unify(api_key="not-a-real-key", endpoint=self.endpoint)
+        client.default_prompt.temperature = 0.1
+        self.assertEqual(client.default_prompt.temperature, 1.0)
+
+
+class TestEndpointValidation(unittest.TestCase):
+    endpoint = "llama-3-8b-chat@together-ai"
+
+    def setUp(self) -> None:
+        patch_listings = patch.dict(uni_llm._listings, clear=True)
+        patch_listings.start()
+        self.addCleanup(patch_listings.stop)
+        self.list_fn = MagicMock(__name__="list_endpoints")
+
+    @patch.object(uni_llm, "_SKIP_VALIDATION", True)
+    def test_skip_validation_does_not_fetch_listings(self) -> None:
+        with patch("unify.list_endpoints") as list_endpoints:
+            client = Unify(api_key="not-a-real-key", endpoint="any-model@any-provider")
+        list_endpoints.assert_not_called()
+        self.assertEqual(client.model, "any-model")
+        self.assertEqual(client.provider, "any-provider")
+
+    @patch.object(uni_llm, "_SKIP_VALIDATION", True)
+    def test_skip_validation_still_checks_the_endpoint_format(self) -> None:
+        for endpoint in ("no-provider", "@provider", "model@", "a@b@c"):
+            with self.subTest(endpoint=endpoint):
+                with self.assertRaisesRegex(Exception, "<model_name>@<provider_name>"):
+                    Unify(api_key="not-a-real-key", endpoint=endpoint)
+
+    @patch.object(uni_llm, "_SKIP_VALIDATION", False)
+    def test_listing_is_reused_while_fresh(self) -> None:
+        self.list_fn.return_value = [self.endpoint]
+        for _ in range(3):
+            listing = uni_llm._get_listing(self.endpoint, self.list_fn, api_key="k")
+            self.assertIn(self.endpoint, listing)
+        self.list_fn.assert_called_once_with(api_key="k")
+
+    @patch.object(uni_llm, "_SKIP_VALIDATION", False)
+    def test_listing_is_refetched_on_a_miss(self) -> None:
+        self.list_fn.side_effect = [[self.endpoint], [self.endpoint, "new@provider"]]
+        uni_llm._get_listing(self.endpoint, self.list_fn, api_key="k")
+        listing = uni_llm._get_listing("new@provider", self.list_fn, api_key="k")
+        self.assertIn("new@provider", listing)
+        self.assertEqual(self.list_fn.call_count, 2)
+
+    @patch.object(uni_llm, "_SKIP_VALIDATION", False)
+    def test_listing_is_refetched_once_stale(self) -> None:
+        self.list_fn.return_value = [self.endpoint]
+        with patch.object(uni_llm.time, "monotonic", return_value=0.0):
+            uni_llm._get_listing(self.endpoint, self.list_fn, api_key="k")
+        stale = float(uni_llm._LISTING_TTL + 1)
+        with patch.object(uni_llm.time, "monotonic", return_value=stale):
+            uni_llm._get_listing(self.endpoint, self.list_fn, api_key="k")
+        self.assertEqual(self.list_fn.call_count, 2)
+
+
+@patch.object(uni_llm, "_SKIP_VALIDATION", True)
+class TestGenerateDefaults(unittest.TestCase):
+    def _sent_temperature(self, client: Unify, **kwargs) -> float:
+        create = MagicMock()
+        create.return_value.choices[0].message.content = "hi"
+        create.return_value.model = "llama-3-8b-chat@together-ai"
+        client._client = MagicMock()
+        client._client.chat.completions.create = create
+        client.generate(user_message="hello", **kwargs)
+        return create.call_args.kwargs["temperature"]
+
+    def test_generation_settings_resolution_order(self) -> None:
+        client = Unify(
+            api_key="not-a-real-key", endpoint="llama-3-8b-chat@together-ai",
+            temperature=0.3,
+        )
+        self.assertEqual(self._sent_temperature(client, temperature=0), 0)
+        self.assertEqual(self._sent_temperature(client), 0.3)
+        client.set_temperature(None)
+        self.assertEqual(self._sent_temperature(client), 1.0)
+
+
 if __name__ == "__main__":
     unittest.main()
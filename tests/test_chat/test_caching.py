@@ -1,9 +1,17 @@
 import os
+import json
 import time
+import asyncio
+import tempfile
 import unittest
+from unittest import mock
 
-from unify import Unify
+from openai.types.chat import ChatCompletion
+
+from unify import Unify, AsyncUnify
+from unify import _caching
 from unify._caching import _cache_fpath
+from unify.chat.clients import uni_llm
 
 
 class TestUnifyCaching(unittest.TestCase):
@@ -31,5 +39,64 @@ class TestUnifyCaching(unittest.TestCase):
         os.remove(_cache_fpath)
 
 
+class TestAsyncUnifyCaching(unittest.TestCase):
+    def setUp(self) -> None:
+        # an empty cache file in a temporary directory, and no endpoint validation,
+        # so that the only request made is the stubbed chat completion
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.cache_fpath = os.path.join(tmp_dir.name, ".cache.json")
+        for patch in (
+            mock.patch.object(_caching, "_cache", None),
+            mock.patch.object(_caching, "_cache_fpath", self.cache_fpath),
+            mock.patch.object(uni_llm, "_SKIP_VALIDATION", True),
+        ):
+            patch.start()
+            self.addCleanup(patch.stop)
+        self.create = mock.AsyncMock(
+            return_value=ChatCompletion.model_validate(
+                {
+                    "id": "cached",
+                    "object": "chat.completion",
+                    "created": 0,
+                    "model": "llama-3-8b-chat@together-ai",
+                    "choices": [
+                        {
+                            "index": 0,
+                            "finish_reason": "stop",
+                            "message": {"role": "assistant", "content": "hi there"},
+                        },
+                    ],
+                },
+            ),
+        )
+        self.client = AsyncUnify(
+            api_key="not-a-real-key", endpoint="llama-3-8b-chat@together-ai"
+        )
+        self.client._client = mock.Mock()
+        self.client._client.chat.completions.create = self.create
+
+    def test_miss_stores_response(self) -> None:
+        r0 = asyncio.run(self.client.generate(user_message="hello", cache=True))
+        self.assertEqual(r0, "hi there")
+        self.assertEqual(self.create.await_count, 1)
+        with open(self.cache_fpath) as f:
+            cached = list(json.load(f).values())
+        self.assertEqual(len(cached), 1)
+        cached = ChatCompletion.model_validate_json(cached[0])
+        self.assertEqual(cached.id, "cached")
+        self.assertEqual(cached.choices[0].message.content, "hi there")
+
+    def test_hit_makes_no_request(self) -> None:
+        async def generate_twice():
+            r0 = await self.client.generate(user_message="hello", cache=True)
+            r1 = await self.client.generate(user_message="hello", cache=True)
+            return r0, r1
+
+        r0, r1 = asyncio.run(generate_twice())
+        self.assertEqual(r0, r1)
+        self.assertEqual(self.create.await_count, 1)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,72 @@
+import sys
+import inspect
+import unittest
+import importlib
+import subprocess
+
+import unify
+import unify.utils
+
+# utils modules whose functions have never been re-exported at the top level
+_NOT_EXPORTED = frozenset({"unify.utils.default_prompts"})
+
+
+def _public_names(module_name: str) -> set:
+    # the public functions and classes defined in (not imported into) the module
+    module = importlib.import_module(module_name)
+    return {
+        name
+        for name, obj in vars(module).items()
+        if not name.startswith("_")
+        and (inspect.isfunction(obj) or inspect.isclass(obj))
+        and obj.__module__ == module_name
+    }
+
+
+def _run_fresh(code: str) -> subprocess.CompletedProcess:
+    # a fresh interpreter, so that no other test has imported the submodules
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+    )
+
+
+class TestLazyImports(unittest.TestCase):
+
+    def test_nested_submodules_resolve(self) -> None:
+        result = _run_fresh(
+            "import unify\n"
+            "unify.utils.custom_api_keys\n"
+            "unify.chat.clients.Unify\n"
+            "unify.chat.chatbot.ChatBot\n",
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+    def test_unknown_attribute_raises(self) -> None:
+        result = _run_fresh(
+            "import unify\n"
+            "for mod in (unify, unify.utils, unify.chat):\n"
+            "    try:\n"
+            "        mod.does_not_exist\n"
+            "    except AttributeError:\n"
+            "        continue\n"
+            "    raise SystemExit(1)\n",
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+    def test_importlib_is_not_public(self) -> None:
+        self.assertNotIn("importlib", dir(unify))
+
+    def test_exports_match_module_definitions(self) -> None:
+        for module_name, names in unify._MODULE_ATTRS.items():
+            with self.subTest(module=module_name):
+                self.assertEqual(set(names), _public_names(module_name))
+
+    def test_utils_modules_with_public_names_are_exported(self) -> None:
+        for name in unify.utils._SUBMODULES:
+            module_name = f"unify.utils.{name}"
+            if module_name in _NOT_EXPORTED or not _public_names(module_name):
+                continue
+            with self.subTest(module=module_name):
+                self.assertIn(module_name, unify._MODULE_ATTRS)
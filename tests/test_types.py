@@ -1,5 +1,6 @@
 import os
 import unify
+from unify.types import _cached_pruned_model, _PRUNED_MODELS_MAXSIZE
 import unittest
 
 dir_path = os.path.dirname(os.path.realpath(__file__))
@@ -75,3 +76,40 @@ class TestDatum(unittest.TestCase):
         datum = unify.Datum(prompt=prompt, ref_answer="Answer")
         self._assert_datum_msg(datum, "Hello")
         self._assert_datum_param(datum, "ref_answer", "Answer")
+
+
+class TestPrunedRepr(unittest.TestCase):
+
+    def test_prompt_repr(self) -> None:
+        prompt = unify.Prompt("hi", temperature=0.5, logit_bias={"1": 2})
+        self.assertEqual(
+            str(prompt),
+            "Prompt(\n"
+            "    messages=[{'content': 'hi', 'role': 'user'}],\n"
+            "    logit_bias={'1': 2},\n"
+            "    temperature=0.5\n"
+            ")\n",
+        )
+
+    def test_datum_repr(self) -> None:
+        datum = unify.Datum("hi", ref_answer="x", score=3)
+        self.assertEqual(
+            str(datum),
+            "Datum(\n"
+            "    prompt=Prompt(messages=[{'content': 'hi', 'role': 'user'}]),\n"
+            "    ref_answer='x',\n"
+            "    score=3\n"
+            ")\n",
+        )
+
+    def test_pruned_model_is_reused(self) -> None:
+        datum = unify.Datum("hi", ref_answer="x")
+        self.assertIs(type(datum._prune()), type(datum._prune()))
+
+    def test_pruned_models_are_bounded(self) -> None:
+        for i in range(_PRUNED_MODELS_MAXSIZE + 10):
+            str(unify.Datum("hi", **{f"extra_{i}": i}))
+        self.assertLessEqual(
+            _cached_pruned_model.cache_info().currsize,
+            _PRUNED_MODELS_MAXSIZE,
+        )
@@ -1,4 +1,5 @@
 import os
+import uuid
 import unify
 import unittest
 
@@ -7,15 +8,21 @@ dir_path = os.path.dirname(os.path.realpath(__file__))
 
 class TestDatasets(unittest.TestCase):
 
+    @staticmethod
+    def _unique_name(prefix: str) -> str:
+        # unique names mean no pre-existing dataset needs to be checked for
+        return f"{prefix}-{uuid.uuid4().hex[:8]}"
+
     def test_upload_and_delete_dataset_from_file(self) -> None:
-        if "TestUploadAndDelete" in unify.list_datasets():
-            unify.delete_dataset("TestUploadAndDelete")
+        name = self._unique_name("TestUploadAndDelete")
         unify.upload_dataset_from_file(
-            "TestUploadAndDelete", os.path.join(dir_path, "prompts.jsonl")
+            name, os.path.join(dir_path, "prompts.jsonl")
         )
-        assert "TestUploadAndDelete" in unify.list_datasets()
-        unify.delete_dataset("TestUploadAndDelete")
-        assert "TestUploadAndDelete" not in unify.list_datasets()
+        try:
+            assert name in unify.list_datasets()
+        finally:
+            unify.delete_dataset(name)
+        assert name not in unify.list_datasets()
 
     def test_upload_and_delete_dataset_from_dict(self) -> None:
         entries = [
@@ -44,12 +51,13 @@ class TestDatasets(unittest.TestCase):
                 "ref_answer": "Third reference answer",
             },
         ]
-        if "TestFromDict" in unify.list_datasets():
-            unify.delete_dataset("TestFromDict")
-        unify.upload_dataset_from_dictionary("TestFromDict", entries)
-        assert "TestFromDict" in unify.list_datasets()
-        unify.delete_dataset("TestFromDict")
-        assert "TestFromDict" not in unify.list_datasets()
+        name = self._unique_name("TestFromDict")
+        unify.upload_dataset_from_dictionary(name, entries)
+        try:
+            assert name in unify.list_datasets()
+        finally:
+            unify.delete_dataset(name)
+        assert name not in unify.list_datasets()
 
     def test_atomic_functions(self):
         entries = [
@@ -79,28 +87,30 @@ class TestDatasets(unittest.TestCase):
             },
         ]
 
-        dataset_name = "TestAtomic"
-        if dataset_name in unify.list_datasets():
-            unify.delete_dataset(dataset_name)
+        dataset_name = self._unique_name("TestAtomic")
         unify.upload_dataset_from_dictionary(dataset_name, entries)
-
-        new_prompt_data = {
-            "prompt": {
-                "messages": [
-                    {"role": "user", "content": "What is the powerhouse of the cell?"}
-                ]
+        try:
+            new_prompt_data = {
+                "prompt": {
+                    "messages": [
+                        {"role": "user", "content": "What is the powerhouse of the cell?"}
+                    ]
+                }
             }
-        }
-        unify.datasets.add_data(dataset_name, new_prompt_data)
-        data = unify.datasets.download_dataset(dataset_name)
-        self.assertTrue(len(data)==4)
+            unify.datasets.add_data(dataset_name, new_prompt_data)
+            data = unify.datasets.download_dataset(dataset_name)
+            self.assertTrue(len(data)==4)
 
-        _id = data[0]["id"]
-        unify.datasets.delete_data(dataset_name, _id, )
-        data = unify.datasets.download_dataset(dataset_name)
-        self.assertTrue(len(data)==3)
+            _id = data[0]["id"]
+            unify.datasets.delete_data(dataset_name, _id, )
+            data = unify.datasets.download_dataset(dataset_name)
+            self.assertTrue(len(data)==3)
 
-        unify.datasets.rename_dataset("TestAtomic", "RenamedTestAtomic")
-        self.assertIn("RenamedTestAtomic", unify.datasets.list_datasets())
-        unify.delete_dataset("RenamedTestAtomic")
+            new_dataset_name = self._unique_name("RenamedTestAtomic")
+            unify.datasets.rename_dataset(dataset_name, new_dataset_name)
+            # the dataset to clean up is whichever name it currently has
+            dataset_name = new_dataset_name
+            self.assertIn(new_dataset_name, unify.datasets.list_datasets())
+        finally:
+            unify.delete_dataset(dataset_name)
 
@@ -0,0 +1,36 @@
+import unittest
+
+from unify.utils.helpers import _default, _session
+
+
+class TestSession(unittest.TestCase):
+    def test_only_reads_are_retried(self) -> None:
+        for prefix in ("https://", "http://"):
+            retries = _session.get_adapter(prefix).max_retries
+            with self.subTest(prefix=prefix):
+                for method in ("GET", "HEAD", "OPTIONS"):
+                    self.assertTrue(retries.is_retry(method, 503))
+                for method in ("POST", "PUT", "PATCH", "DELETE"):
+                    self.assertFalse(retries.is_retry(method, 503))
+
+
+class TestDefault(unittest.TestCase):
+    def test_value_takes_precedence(self) -> None:
+        self.assertEqual(_default(0.2, 0.5, 1.0), 0.2)
+
+    def test_default_value_when_value_is_none(self) -> None:
+        self.assertEqual(_default(None, 0.5, 1.0), 0.5)
+
+    def test_fallback_when_both_are_none(self) -> None:
+        self.assertEqual(_default(None, None, 1.0), 1.0)
+        self.assertIsNone(_default(None, None))
+
+    def test_falsy_values_are_kept(self) -> None:
+        self.assertEqual(_default(0, 0.5, 1.0), 0)
+        self.assertIs(_default(False, True, True), False)
+        self.assertEqual(_default(None, 0, 1.0), 0)
+        self.assertIs(_default(None, False, True), False)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,49 +1,144 @@
 """Unify python module."""
 import os
+import importlib as _importlib
 
-if "UNIFY_BASE_URL" in os.environ.keys():
-    BASE_URL = os.environ["UNIFY_BASE_URL"]
-else:
-    BASE_URL = "https://api.unify.ai/v0"
-
-from .utils import (
-    credits,
-    custom_api_keys,
-    custom_endpoints,
-    datasets,
-    efficiency_benchmarks,
-    evaluations,
-    evaluators,
-    helpers,
-    logging,
-    router_configurations,
-    router_deployment,
-    router_training,
-    supported_endpoints,
-)
-from .utils.credits import *
-from .utils.custom_api_keys import *
-from .utils.custom_endpoints import *
-from .utils.datasets import *
-from .utils.efficiency_benchmarks import *
-from .utils.evaluations import *
-from .utils.evaluators import *
-from .utils.helpers import *
-from .utils.logging import *
-from .utils.router_configurations import *
-from .utils.router_deployment import *
-from .utils.router_training import *
-from .utils.supported_endpoints import *
-
-from .chat import chatbot, clients
-from .chat.clients import multi_llm
-from .chat.chatbot import *
-from unify.chat.clients.uni_llm import *
-from unify.chat.clients.multi_llm import *
-
-from .agent import *
-from .dataset import *
-from .evaluation import *
-from .evaluator import *
-from .logging import *
-from .types import *
+BASE_URL = os.environ.get("UNIFY_BASE_URL", "https://api.unify.ai/v0")
+
+# Submodules and public objects are imported lazily on first attribute access
+# (PEP 562), so `import unify` does not pay for openai, pydantic and rich until
+# something which needs them is actually used.
+
+_SUBMODULES = {
+    # utils
+    "credits": "unify.utils.credits",
+    "custom_api_keys": "unify.utils.custom_api_keys",
+    "custom_endpoints": "unify.utils.custom_endpoints",
+    "datasets": "unify.utils.datasets",
+    "efficiency_benchmarks": "unify.utils.efficiency_benchmarks",
+    "evaluations": "unify.utils.evaluations",
+    "evaluators": "unify.utils.evaluators",
+    "helpers": "unify.utils.helpers",
+    "router_configurations": "unify.utils.router_configurations",
+    "router_deployment": "unify.utils.router_deployment",
+    "router_training": "unify.utils.router_training",
+    "supported_endpoints": "unify.utils.supported_endpoints",
+    # chat
+    "chat": "unify.chat",
+    "chatbot": "unify.chat.chatbot",
+    "clients": "unify.chat.clients",
+    "multi_llm": "unify.chat.clients.multi_llm",
+    # top-level
+    "agent": "unify.agent",
+    "dataset": "unify.dataset",
+    "evaluation": "unify.evaluation",
+    "evaluator": "unify.evaluator",
+    "logging": "unify.logging",
+    "types": "unify.types",
+    "utils": "unify.utils",
+}
+
+_MODULE_ATTRS = {
+    # utils
+    "unify.utils.credits": ("get_credits", "promo_code"),
+    "unify.utils.custom_api_keys": (
+        "create_custom_api_key",
+        "get_custom_api_key",
+        "rename_custom_api_key",
+        "delete_custom_api_key",
+        "list_custom_api_keys",
+    ),
+    "unify.utils.custom_endpoints": (
+        "create_custom_endpoint",
+        "delete_custom_endpoint",
+        "rename_custom_endpoint",
+        "list_custom_endpoints",
+    ),
+    "unify.utils.datasets": (
+        "upload_dataset_from_file",
+        "upload_dataset_from_dictionary",
+        "download_dataset",
+        "delete_dataset",
+        "rename_dataset",
+        "list_datasets",
+        "add_data",
+        "delete_data",
+    ),
+    "unify.utils.efficiency_benchmarks": (
+        "append_to_benchmark",
+        "get_benchmark",
+        "delete_benchmark",
+    ),
+    "unify.utils.evaluations": (
+        "trigger_evaluation",
+        "get_evaluations",
+        "delete_evaluations",
+    ),
+    "unify.utils.evaluators": (
+        "create_evaluator",
+        "get_evaluator",
+        "delete_evaluator",
+        "rename_evaluator",
+        "list_evaluators",
+    ),
+    "unify.utils.logging": (
+        "log_query",
+        "get_queries",
+        "get_query_tags",
+        "get_query_metrics",
+    ),
+    "unify.utils.router_configurations": (
+        "create_router_config",
+        "get_router_config",
+        "delete_router_config",
+        "rename_router_config",
+        "list_router_configs",
+    ),
+    "unify.utils.router_deployment": (
+        "deploy_router",
+        "undeploy_router",
+        "list_deployed_routers",
+    ),
+    "unify.utils.router_training": (
+        "train_router",
+        "delete_router",
+        "rename_router",
+        "list_routers",
+    ),
+    "unify.utils.supported_endpoints": (
+        "list_endpoints",
+        "list_models",
+        "list_providers",
+    ),
+    # chat
+    "unify.chat.chatbot": ("ChatBot",),
+    "unify.chat.clients.uni_llm": ("Unify", "AsyncUnify"),
+    "unify.chat.clients.multi_llm": ("MultiLLM", "MultiLLMAsync"),
+    # top-level
+    "unify.agent": ("Agent",),
+    "unify.dataset": ("Dataset",),
+    "unify.evaluation": ("Evaluation",),
+    "unify.evaluator": ("Evaluator",),
+    "unify.logging": ("with_logging",),
+    "unify.types": ("Prompt", "ChatCompletion", "Datum", "Score"),
+}
+
+_ATTRS = {
+    name: module for module, names in _MODULE_ATTRS.items() for name in names
+}
+
+__all__ = ["BASE_URL", *_SUBMODULES, *_ATTRS]
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        value = _importlib.import_module(_SUBMODULES[name])
+    elif name in _ATTRS:
+        value = getattr(_importlib.import_module(_ATTRS[name]), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *__all__})
@@ -1,37 +1,51 @@
 import os
 import json
+import hashlib
+import threading
 from typing import Dict, Union
 from openai.types.chat.chat_completion import ChatCompletion
 
 _cache = None
 _cache_fpath: str = os.path.join(os.getcwd(), ".cache.json")
+# AsyncUnify reads and writes the cache from worker threads
+_cache_lock = threading.Lock()
 
 
 def _create_cache_if_none():
     global _cache
-    if _cache is None:
-        if not os.path.exists(_cache_fpath):
-            with open(_cache_fpath, "w") as outfile:
-                json.dump({}, outfile)
-        with open(_cache_fpath) as outfile:
-            _cache = json.load(outfile)
+    if _cache is not None:
+        return
+    with _cache_lock:
+        if _cache is None:
+            if not os.path.exists(_cache_fpath):
+                with open(_cache_fpath, "w") as outfile:
+                    json.dump({}, outfile)
+            with open(_cache_fpath) as outfile:
+                _cache = json.load(outfile)
+
+
+def _cache_key(kw: Dict) -> str:
+    # keys are sorted so that equal requests map to the same entry regardless of
+    # argument order, and hashed so that long prompts give short cache keys
+    kw = {k: v for k, v in kw.items() if v is not None}
+    kw_str = json.dumps(kw, sort_keys=True, separators=(",", ":"))
+    return hashlib.blake2b(kw_str.encode(), digest_size=16).hexdigest()
 
 
 # noinspection PyTypeChecker,PyUnboundLocalVariable
 def _get_cache(kw: Dict) -> Union[None, Dict]:
     _create_cache_if_none()
-    kw = {k: v for k, v in kw.items() if v is not None}
-    kw_str = json.dumps(kw)
+    kw_str = _cache_key(kw)
     if kw_str in _cache:
-        return ChatCompletion.parse_obj(json.loads(_cache[kw_str]))
+        return ChatCompletion.model_validate_json(_cache[kw_str])
 
 
 # noinspection PyTypeChecker,PyUnresolvedReferences
 def _write_to_cache(kw, response):
     _create_cache_if_none()
-    kw = {k: v for k, v in kw.items() if v is not None}
-    kw_str = json.dumps(kw)
-    response_str = json.dumps(response.model_dump())
-    _cache[kw_str] = response_str
-    with open(_cache_fpath, "w") as outfile:
-        json.dump(_cache, outfile)
+    kw_str = _cache_key(kw)
+    response_str = response.model_dump_json()
+    with _cache_lock:
+        _cache[kw_str] = response_str
+        with open(_cache_fpath, "w") as outfile:
+            json.dump(_cache, outfile)
@@ -1,14 +1,25 @@
 import sys
 import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Union, Dict
 
 import unify
 from unify.chat.clients import _Client, _UniLLMClient, _MultiLLMClient
 
+# commands which can be entered in place of a message, see ChatBot._on_<command>
+_COMMANDS = frozenset({"quit", "pause"})
+
+_CONTENT_ONLY_ERR = (
+    "ChatBot currently only supports clients which only generate the message "
+    "content in the return"
+)
+
 
 class ChatBot:  # noqa: WPS338
     """Agent class represents an LLM chat agent."""
 
+    __slots__ = ("_paused", "_client", "_last_credit_balance")
+
     def __init__(
         self,
         client: _Client,
@@ -18,10 +29,14 @@ class ChatBot:  # noqa: WPS338
 
         Args:
             client: The Client instance to wrap the chatbot logic around.
+
+        Raises:
+            ValueError: If the client does not only return the message content.
         """
         self._paused = False
-        assert client.message_content_only, ("ChatBot currently only supports clients which only generate the message "
-                                             "content in the return")
+        self._last_credit_balance = None
+        if not client.message_content_only:
+            raise ValueError(_CONTENT_ONLY_ERR)
         self._client = client
         self.clear_chat_history()
 
@@ -56,6 +71,18 @@ class ChatBot:  # noqa: WPS338
         """
         return self._client.get_credit_balance()
 
+    def _prefetch_credits(self) -> Future:
+        """
+        Starts retrieving the current credit balance in a background thread.
+
+        Returns:
+            Future resolving to the current credit balance.
+        """
+        executor = ThreadPoolExecutor(max_workers=1)
+        credits = executor.submit(self._get_credits)
+        executor.shutdown(wait=False)
+        return credits
+
     def _update_message_history(self, role: str, content: Union[str, Dict[str, str]]) -> None:
         """
         Updates message history with user input.
@@ -91,13 +118,14 @@ class ChatBot:  # noqa: WPS338
 
     @staticmethod
     def _stream_response(response) -> str:
-        words = ""
+        words = []
+        write, flush = sys.stdout.write, sys.stdout.flush
         for chunk in response:
-            words += chunk
-            sys.stdout.write(chunk)
-            sys.stdout.flush()
-        sys.stdout.write("\n")
-        return words
+            words.append(chunk)
+            write(chunk)
+            flush()
+        write("\n")
+        return "".join(words)
 
     def _handle_uni_llm_response(self, response: str, endpoint: Union[bool, str]) -> str:
         if endpoint:
@@ -107,8 +135,7 @@ class ChatBot:  # noqa: WPS338
             words = self._stream_response(response)
         else:
             words = response
-            sys.stdout.write(words)
-            sys.stdout.write("\n\n")
+            sys.stdout.write(f"{words}\n\n")
         return words
 
     def _handle_multi_llm_response(self, response: Dict[str, str]) -> Dict[str, str]:
@@ -128,6 +155,12 @@ class ChatBot:  # noqa: WPS338
             content=response,
         )
 
+    def _on_quit(self) -> None:
+        self.clear_chat_history()
+
+    def _on_pause(self) -> None:
+        self._paused = True
+
     def run(self, show_credits: bool = False, show_endpoint: bool = False) -> None:
         """
         Starts the chat interaction loop.
@@ -146,24 +179,30 @@ class ChatBot:  # noqa: WPS338
                 "Welcome back! (Remember, enter `pause` to pause and `quit` to exit)\n",
             )
         self._paused = False
+        # the balance may have changed elsewhere while the chat was not running, so
+        # it is fetched again, in the background while the first message is typed
+        self._last_credit_balance = None
+        opening_credit_balance = self._prefetch_credits() if show_credits else None
         while True:
             sys.stdout.write("> ")
             inp = input()
-            if inp == "quit":
-                self.clear_chat_history()
-                break
-            elif inp == "pause":
-                self._paused = True
+            if inp in _COMMANDS:
+                getattr(self, "_on_" + inp)()
                 break
             self._update_message_history(role="user", content=inp)
-            initial_credit_balance = self._get_credits()
+            if show_credits:
+                # the final balance of the previous turn is this turn's initial one
+                initial_credit_balance = self._last_credit_balance
+                if initial_credit_balance is None:
+                    initial_credit_balance = opening_credit_balance.result()
             if isinstance(self._client, unify.AsyncUnify):
                 response = asyncio.run(self._client.generate())
             else:
                 response = self._client.generate()
             self._handle_response(response, show_endpoint)
-            final_credit_balance = self._get_credits()
             if show_credits:
+                final_credit_balance = self._get_credits()
+                self._last_credit_balance = final_credit_balance
                 sys.stdout.write(
                     "\n(spent {:.6f} credits)".format(
                         initial_credit_balance - final_credit_balance,
@@ -1,5 +1,4 @@
 # global
-import requests
 from openai._types import Headers, Query, Body
 from openai.types.chat import (
     ChatCompletionToolParam,
@@ -14,12 +13,43 @@ from typing import Mapping, Dict, List, Optional, Union, Iterable
 # local
 from unify import BASE_URL
 from unify.types import Prompt
-from unify.utils.helpers import _validate_api_key, _default
+from unify.utils.helpers import _validate_api_key, _default, _session
 
 
 class _Client(ABC):
     """Base Abstract class for interacting with the Unify chat completions endpoint."""
 
+    __slots__ = (
+        "_api_key",
+        "_system_message",
+        "_messages",
+        "_frequency_penalty",
+        "_logit_bias",
+        "_logprobs",
+        "_top_logprobs",
+        "_max_completion_tokens",
+        "_n",
+        "_presence_penalty",
+        "_response_format",
+        "_seed",
+        "_stop",
+        "_stream",
+        "_stream_options",
+        "_temperature",
+        "_top_p",
+        "_tools",
+        "_tool_choice",
+        "_parallel_tool_calls",
+        "_use_custom_keys",
+        "_tags",
+        "_message_content_only",
+        "_cache",
+        "_extra_headers",
+        "_extra_query",
+        "_extra_body",
+        "_default_prompt",
+    )
+
     def __init__(
         self,
         *,
@@ -183,61 +213,37 @@ class _Client(ABC):
             UnifyError: If the API key is missing.
         """
         self._api_key = _validate_api_key(api_key)
-        self._system_message = None
-        self.set_system_message(system_message)
-        self._messages = None
-        self.set_messages(messages)
-        self._frequency_penalty = None
-        self.set_frequency_penalty(frequency_penalty)
-        self._logit_bias = None
-        self.set_logit_bias(logit_bias)
-        self._logprobs = None
-        self.set_logprobs(logprobs)
-        self._top_logprobs = None
-        self.set_top_logprobs(top_logprobs)
-        self._max_completion_tokens = None
-        self.set_max_completion_tokens(max_completion_tokens)
-        self._n = None
-        self.set_n(n)
-        self._presence_penalty = None
-        self.set_presence_penalty(presence_penalty)
-        self._response_format = None
-        self.set_response_format(response_format)
-        self._seed = None
-        self.set_seed(seed)
-        self._stop = None
-        self.set_stop(stop)
-        self._stream = None
-        self.set_stream(stream)
-        self._stream_options = None
-        self.set_stream_options(stream_options)
-        self._temperature = None
-        self.set_temperature(temperature)
-        self._top_p = None
-        self.set_top_p(top_p)
-        self._tools = None
-        self.set_tools(tools)
-        self._tool_choice = None
-        self.set_tool_choice(tool_choice)
-        self._parallel_tool_calls = None
-        self.set_parallel_tool_calls(parallel_tool_calls)
+        self._system_message = system_message
+        self._messages = messages
+        self._frequency_penalty = frequency_penalty
+        self._logit_bias = logit_bias
+        self._logprobs = logprobs
+        self._top_logprobs = top_logprobs
+        self._max_completion_tokens = max_completion_tokens
+        self._n = n
+        self._presence_penalty = presence_penalty
+        self._response_format = response_format
+        self._seed = seed
+        self._stop = stop
+        self._stream = stream
+        self._stream_options = stream_options
+        self._temperature = temperature
+        self._top_p = top_p
+        self._tools = tools
+        self._tool_choice = tool_choice
+        self._parallel_tool_calls = parallel_tool_calls
         # platform arguments
-        self._use_custom_keys = None
-        self.set_use_custom_keys(use_custom_keys)
-        self._tags = None
-        self.set_tags(tags)
+        self._use_custom_keys = use_custom_keys
+        self._tags = tags
         # python client arguments
-        self._message_content_only = None
-        self.set_message_content_only(message_content_only)
-        self._cache = None
-        self.set_cache(cache)
+        self._message_content_only = message_content_only
+        self._cache = cache
         # passthrough arguments
-        self._extra_headers = None
-        self.set_extra_headers(extra_headers)
-        self._extra_query = None
-        self.set_extra_query(extra_query)
-        self._extra_body = None
-        self.set_extra_body(kwargs)
+        self._extra_headers = extra_headers
+        self._extra_query = extra_query
+        self._extra_body = kwargs
+        # built on first access, and reset by the setters of the prompt fields
+        self._default_prompt = None
 
     # Properties #
     # -----------#
@@ -509,13 +515,24 @@ class _Client(ABC):
         """
         Get the default prompt, if set.
 
+        The prompt is built on first access and reused until a prompt field is set
+        again through its setter, so in-place edits such as client.messages.append
+        are only reflected once the setter is called. A shallow copy is returned,
+        which shares its containers (e.g. messages) with the cached prompt.
+
         Returns:
               The default prompt.
         """
-        return Prompt(
-            **{f: getattr(self, f) for f in Prompt.model_fields if
-               hasattr(self, f) and getattr(self, f)}
-        )
+        if self._default_prompt is None:
+            # unset fields and empty containers are left out of the prompt
+            self._default_prompt = Prompt(
+                **{
+                    f: v
+                    for f in _PROMPT_FIELDS
+                    if (v := getattr(self, f)) is not None and v not in ([], {})
+                },
+            )
+        return self._default_prompt.model_copy()
 
     # Setters #
     # --------#
@@ -541,6 +558,7 @@ class _Client(ABC):
             value: The default messages.
         """
         self._messages = value
+        self._default_prompt = None
 
     def set_frequency_penalty(self, value: float) -> None:
         """
@@ -550,6 +568,7 @@ class _Client(ABC):
             value: The default frequency penalty.
         """
         self._frequency_penalty = value
+        self._default_prompt = None
 
     def set_logit_bias(self, value: Dict[str, int]) -> None:
         """
@@ -559,6 +578,7 @@ class _Client(ABC):
             value: The default logit bias.
         """
         self._logit_bias = value
+        self._default_prompt = None
 
     def set_logprobs(self, value: bool) -> None:
         """
@@ -568,6 +588,7 @@ class _Client(ABC):
             value: The default logprobs.
         """
         self._logprobs = value
+        self._default_prompt = None
 
     def set_top_logprobs(self, value: int) -> None:
         """
@@ -577,6 +598,7 @@ class _Client(ABC):
             value: The default top logprobs.
         """
         self._top_logprobs = value
+        self._default_prompt = None
 
     def set_max_completion_tokens(self, value: int) -> None:
         """
@@ -586,6 +608,7 @@ class _Client(ABC):
             value: The default max tokens.
         """
         self._max_completion_tokens = value
+        self._default_prompt = None
 
     def set_n(self, value: int) -> None:
         """
@@ -595,6 +618,7 @@ class _Client(ABC):
             value: The default n value.
         """
         self._n = value
+        self._default_prompt = None
 
     def set_presence_penalty(self, value: float) -> None:
         """
@@ -604,6 +628,7 @@ class _Client(ABC):
             value: The default presence penalty.
         """
         self._presence_penalty = value
+        self._default_prompt = None
 
     def set_response_format(self, value: ResponseFormat) -> None:
         """
@@ -613,6 +638,7 @@ class _Client(ABC):
             value: The default response format.
         """
         self._response_format = value
+        self._default_prompt = None
 
     def set_seed(self, value: int) -> None:
         """
@@ -622,6 +648,7 @@ class _Client(ABC):
             value: The default seed value.
         """
         self._seed = value
+        self._default_prompt = None
 
     def set_stop(self, value: Union[str, List[str]]) -> None:
         """
@@ -631,6 +658,7 @@ class _Client(ABC):
             value: The default stop value.
         """
         self._stop = value
+        self._default_prompt = None
 
     def set_stream(self, value: bool) -> None:
         """
@@ -658,6 +686,7 @@ class _Client(ABC):
             value: The default temperature.
         """
         self._temperature = value
+        self._default_prompt = None
 
     def set_top_p(self, value: float) -> None:
         """
@@ -667,6 +696,7 @@ class _Client(ABC):
             value: The default top p value.
         """
         self._top_p = value
+        self._default_prompt = None
 
     def set_tools(self, value: Iterable[ChatCompletionToolParam]) -> None:
         """
@@ -676,6 +706,7 @@ class _Client(ABC):
             value: The default tools.
         """
         self._tools = value
+        self._default_prompt = None
 
     def set_tool_choice(self, value: ChatCompletionToolChoiceOptionParam) -> None:
         """
@@ -685,6 +716,7 @@ class _Client(ABC):
             value: The default tool choice.
         """
         self._tool_choice = value
+        self._default_prompt = None
 
     def set_parallel_tool_calls(self, value: bool) -> None:
         """
@@ -694,6 +726,7 @@ class _Client(ABC):
             value: The default parallel tool calls bool.
         """
         self._parallel_tool_calls = value
+        self._default_prompt = None
 
     def set_use_custom_keys(self, value: bool) -> None:
         """
@@ -739,6 +772,7 @@ class _Client(ABC):
             value: The default extra headers.
         """
         self._extra_headers = value
+        self._default_prompt = None
 
     def set_extra_query(self, value: Query) -> None:
         """
@@ -748,6 +782,7 @@ class _Client(ABC):
             value: The default extra query.
         """
         self._extra_query = value
+        self._default_prompt = None
 
     def set_extra_body(self, value: Body) -> None:
         """
@@ -757,6 +792,7 @@ class _Client(ABC):
             value: The default extra body.
         """
         self._extra_body = value
+        self._default_prompt = None
 
     def set_default_prompt(self, value: Prompt) -> None:
         """
@@ -765,9 +801,8 @@ class _Client(ABC):
         Args:
               The default prompt.
         """
-        for f in value.model_fields:
-            if hasattr(self, f):
-                getattr(self, "set_" + f)(getattr(value, f))
+        for f, setter in _PROMPT_SETTERS:
+            setter(self, getattr(value, f))
 
     # Generate #
     # ---------#
@@ -942,6 +977,8 @@ class _Client(ABC):
         Raises:
             UnifyError: If an error occurs during content generation.
         """
+        # the passthrough body only needs merging when the call adds to it
+        extra_body = {**self._extra_body, **kwargs} if kwargs else self._extra_body
         return self._generate(
             user_message,
             _default(system_message, self._system_message),
@@ -950,32 +987,32 @@ class _Client(ABC):
             logit_bias=_default(logit_bias, self._logit_bias),
             logprobs=_default(logprobs, self._logprobs),
             top_logprobs=_default(top_logprobs, self._top_logprobs),
-            max_completion_tokens=_default(_default(max_completion_tokens, self._max_completion_tokens), 1024),
+            max_completion_tokens=_default(max_completion_tokens,
+                                           self._max_completion_tokens, 1024),
             n=_default(n, self._n),
             presence_penalty=_default(presence_penalty, self._presence_penalty),
             response_format=_default(response_format, self._response_format),
             seed=_default(seed, self._seed),
             stop=_default(stop, self._stop),
-            stream=_default(_default(stream, self._stream), False),
+            stream=_default(stream, self._stream, False),
             stream_options=_default(stream_options, self._stream_options),
-            temperature=_default(_default(temperature, self._temperature), 1.0),
+            temperature=_default(temperature, self._temperature, 1.0),
             top_p=_default(top_p, self._top_p),
             tools=_default(tools, self._tools),
             tool_choice=_default(tool_choice, self._tool_choice),
             parallel_tool_calls=_default(parallel_tool_calls,
                                          self._parallel_tool_calls),
             # platform arguments
-            use_custom_keys=_default(
-                _default(use_custom_keys, self._use_custom_keys), False),
+            use_custom_keys=_default(use_custom_keys, self._use_custom_keys, False),
             tags=_default(tags, self._tags),
             # python client arguments
-            message_content_only=_default(_default(message_content_only,
-                                          self._message_content_only), True),
-            cache=_default(_default(cache, self._cache), False),
+            message_content_only=_default(message_content_only,
+                                          self._message_content_only, True),
+            cache=_default(cache, self._cache, False),
             # passthrough arguments
             extra_headers=_default(extra_headers, self._extra_headers),
             extra_query=_default(extra_query, self._extra_query),
-            **{**self._extra_body, **kwargs},
+            **extra_body,
         )
 
     # Credits #
@@ -989,7 +1026,7 @@ class _Client(ABC):
         Returns:
             The remaining credits on the account if successful, otherwise None.
         Raises:
-            BadRequestError: If there was an HTTP error.
+            requests.HTTPError: If the API request fails.
             ValueError: If there was an error parsing the JSON response.
         """
         url = f"{BASE_URL}/credits"
@@ -997,13 +1034,10 @@ class _Client(ABC):
             "accept": "application/json",
             "Authorization": f"Bearer {self._api_key}",
         }
+        response = _session.get(url, headers=headers, timeout=(3, 10))
+        response.raise_for_status()
         try:
-            response = requests.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
             return response.json()["credits"]
-        except requests.RequestException as e:
-            raise requests.RequestException(
-                "There was an error with the request.") from e
         except (KeyError, ValueError) as e:
             raise ValueError("Error parsing JSON response.") from e
 
@@ -1048,3 +1082,10 @@ class _Client(ABC):
             **kwargs,
     ):
         raise NotImplementedError
+
+
+# Prompt fields which have a matching default on the client
+_PROMPT_FIELDS = tuple(f for f in Prompt.model_fields if hasattr(_Client, f))
+
+# (field, setter) pairs used to copy a Prompt onto the client
+_PROMPT_SETTERS = tuple((f, getattr(_Client, "set_" + f)) for f in _PROMPT_FIELDS)
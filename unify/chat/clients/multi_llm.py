@@ -1,7 +1,6 @@
 # global
 import abc
 import asyncio
-import requests
 from typing import Optional, Union, List, Tuple, Dict, Iterable
 from openai._types import Headers, Query, Body
 from openai.types.chat import (
@@ -13,12 +12,14 @@ from openai.types.chat.completion_create_params import ResponseFormat
 
 # local
 from unify import BASE_URL
-from unify.utils.helpers import _validate_api_key
+from unify.utils.helpers import _validate_api_key, _session
 from unify.chat.clients import _Client, _UniLLMClient, Unify, AsyncUnify
 
 
 class _MultiLLMClient(_Client, abc.ABC):
 
+    __slots__ = ("_endpoints", "_client_class", "_clients")
+
     def __init__(
         self,
         endpoints: Optional[Iterable[str]] = None,
@@ -181,7 +182,7 @@ class _MultiLLMClient(_Client, abc.ABC):
         Returns:
             The remaining credits on the account if successful, otherwise None.
         Raises:
-            BadRequestError: If there was an HTTP error.
+            requests.HTTPError: If the API request fails.
             ValueError: If there was an error parsing the JSON response.
         """
         url = f"{BASE_URL}/credits"
@@ -189,12 +190,10 @@ class _MultiLLMClient(_Client, abc.ABC):
             "accept": "application/json",
             "Authorization": f"Bearer {self._api_key}",
         }
+        response = _session.get(url, headers=headers, timeout=(3, 10))
+        response.raise_for_status()
         try:
-            response = requests.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
             return response.json()["credits"]
-        except requests.RequestException as e:
-            raise Exception("There was an error with the request.") from e
         except (KeyError, ValueError) as e:
             raise ValueError("Error parsing JSON response.") from e
 
@@ -218,6 +217,8 @@ class _MultiLLMClient(_Client, abc.ABC):
 
 class MultiLLM(_MultiLLMClient):
 
+    __slots__ = ()
+
     def __init__(
         self,
         endpoints: Optional[Iterable[str]] = None,
@@ -349,18 +350,22 @@ class MultiLLM(_MultiLLMClient):
         async def gen(kw_):
             multi_message = isinstance(messages, dict)
             kw_ = {k: v for k, v in kw_.items() if v is not None}
-            responses = dict()
+            coros = list()
             for endpoint, client in self._clients.items():
                 these_kw = kw_.copy()
                 if multi_message:
                     these_kw["messages"] = these_kw["messages"][endpoint]
-                responses[endpoint] = await client.generate(**these_kw)
-            return responses
+                coros.append(client.generate(**these_kw))
+            # the endpoints are queried concurrently, so the call takes as long as
+            # the slowest endpoint rather than the sum over all of them
+            return dict(zip(self._clients, await asyncio.gather(*coros)))
         return asyncio.run(gen(kw))
 
 
 class MultiLLMAsync(_MultiLLMClient):
 
+    __slots__ = ()
+
     def __init__(
         self,
         endpoints: Optional[Iterable[str]] = None,
@@ -489,10 +494,11 @@ class MultiLLMAsync(_MultiLLMClient):
         )
         multi_message = isinstance(messages, dict)
         kw = {k: v for k, v in kw.items() if v is not None}
-        responses = dict()
+        coros = list()
         for endpoint, client in self._clients.items():
             these_kw = kw.copy()
             if multi_message:
                 these_kw["messages"] = these_kw["messages"][endpoint]
-            responses[endpoint] = await client.generate(**these_kw)
-        return responses
+            coros.append(client.generate(**these_kw))
+        # the endpoints are queried concurrently, see MultiLLM._generate
+        return dict(zip(self._clients, await asyncio.gather(*coros)))
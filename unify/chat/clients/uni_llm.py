@@ -1,5 +1,9 @@
 # global
+import os
 import abc
+import time
+import asyncio
+import functools
 import openai
 from openai._types import Headers, Query, Body
 from openai.types.chat import (
@@ -9,7 +13,17 @@ from openai.types.chat import (
     ChatCompletionStreamOptionsParam,
 )
 from openai.types.chat.completion_create_params import ResponseFormat
-from typing import AsyncGenerator, Dict, Generator, List, Optional, Union, Iterable
+from typing import (
+    AsyncGenerator,
+    Callable,
+    Dict,
+    FrozenSet,
+    Generator,
+    List,
+    Optional,
+    Union,
+    Iterable,
+)
 
 # local
 import unify
@@ -19,8 +33,46 @@ from unify.types import Prompt, ChatCompletion
 from unify._caching import _get_cache, _write_to_cache
 
 
+@functools.lru_cache(maxsize=None)
+def _get_openai_client(api_key: str) -> openai.OpenAI:
+    # shared by all the Unify clients with the same key, so that they also share
+    # the underlying connection pool rather than each opening their own
+    return openai.OpenAI(
+        base_url=f"{BASE_URL}",
+        api_key=api_key,
+    )
+
+
+# endpoint, model and provider listings used for validation, reused for a few minutes
+# so that creating clients and setting the provider of each response stays offline
+_LISTING_TTL = 300
+_listings = dict()
+
+# set UNIFY_SKIP_VALIDATION=1 to trust the configured endpoints, models and providers
+# without checking them against the listings, e.g. when clients are created per request
+_SKIP_VALIDATION = os.environ.get("UNIFY_SKIP_VALIDATION") == "1"
+
+
+def _get_listing(
+    value: str, list_fn: Callable, *args, api_key: str
+) -> FrozenSet[str]:
+    if _SKIP_VALIDATION:
+        return frozenset((value,))
+    key = (list_fn.__name__, args, api_key)
+    cached = _listings.get(key)
+    if cached is not None and time.monotonic() - cached[0] < _LISTING_TTL:
+        if value in cached[1]:
+            return cached[1]
+    # missing or stale, or the value may have been added since it was fetched
+    listing = frozenset(list_fn(*args, api_key=api_key))
+    _listings[key] = (time.monotonic(), listing)
+    return listing
+
+
 class _UniLLMClient(_Client, abc.ABC):
 
+    __slots__ = ("_client", "_endpoint", "_provider", "_model")
+
     def __init__(
         self,
         endpoint: Optional[str] = None,
@@ -282,14 +334,23 @@ class _UniLLMClient(_Client, abc.ABC):
         Args:
             value: The endpoint name.
         """
-        valid_endpoints = unify.list_endpoints(api_key=self._api_key)
+        # checked even when validation is skipped, the listings only hold this form
+        model, _, provider = value.partition("@")
+        if not model or not provider or "@" in provider:
+            raise Exception(
+                "The specified endpoint {} is not of the form "
+                "<model_name>@<provider_name>".format(value)
+            )
+        valid_endpoints = _get_listing(
+            value, unify.list_endpoints, api_key=self._api_key
+        )
         if value not in valid_endpoints:
             raise Exception(
                 "The specified endpoint {} is not one of the endpoints supported by "
-                "Unify: {}".format(value, valid_endpoints)
+                "Unify: {}".format(value, sorted(valid_endpoints))
             )
         self._endpoint = value
-        self._model, self._provider = value.split("@")  # noqa: WPS414
+        self._model, self._provider = model, provider  # noqa: WPS414
 
     def set_model(self, value: str) -> None:
         """
@@ -298,18 +359,20 @@ class _UniLLMClient(_Client, abc.ABC):
         Args:
             value: The model name.
         """
-        valid_models = unify.list_models(self._provider, api_key=self._api_key)
+        valid_models = _get_listing(
+            value, unify.list_models, self._provider, api_key=self._api_key
+        )
         if value not in valid_models:
             if self._provider:
                 raise Exception(
                     "Current provider {} does not support the specified model {},"
                     "please select one of: {}".format(
-                        self._provider, value, valid_models
+                        self._provider, value, sorted(valid_models)
                     )
                 )
             raise Exception(
                 "The specified model {} is not one of the models supported by Unify: {}".format(
-                    value, valid_models
+                    value, sorted(valid_models)
                 )
             )
         self._model = value
@@ -323,18 +386,20 @@ class _UniLLMClient(_Client, abc.ABC):
         Args:
             value: The provider name.
         """
-        valid_providers = unify.list_providers(self._model, api_key=self._api_key)
+        valid_providers = _get_listing(
+            value, unify.list_providers, self._model, api_key=self._api_key
+        )
         if value not in valid_providers:
             if self._model:
                 raise Exception(
                     "Current model {} does not support the specified provider {},"
                     "please select one of: {}".format(
-                        self._model, value, valid_providers
+                        self._model, value, sorted(valid_providers)
                     )
                 )
             raise Exception(
                 "The specified provider {} is not one of the providers supported by "
-                "Unify: {}".format(value, valid_providers)
+                "Unify: {}".format(value, sorted(valid_providers))
             )
         self._provider = value
         if self._model:
@@ -361,12 +426,11 @@ class Unify(_UniLLMClient):
     """Class for interacting with the Unify chat completions endpoint in a synchronous
     manner."""
 
+    __slots__ = ()
+
     def _get_client(self):
         try:
-            return openai.OpenAI(
-                base_url=f"{BASE_URL}",
-                api_key=self._api_key,
-            )
+            return _get_openai_client(self._api_key)
         except openai.OpenAIError as e:
             raise Exception(f"Failed to initialize Unify client: {str(e)}")
 
@@ -382,12 +446,8 @@ class Unify(_UniLLMClient):
         # python client arguments
         message_content_only: bool = True,
     ) -> Generator[str, None, None]:
-        prompt_dict = prompt.model_dump()
-        if "extra_body" in prompt_dict:
-            extra_body = prompt_dict["extra_body"]
-            del prompt_dict["extra_body"]
-        else:
-            extra_body = {}
+        prompt_dict = prompt.model_dump(exclude_none=True, exclude={"extra_body"})
+        extra_body = prompt.extra_body or {}
         kw = dict(
             model=endpoint,
             **prompt_dict,
@@ -404,12 +464,16 @@ class Unify(_UniLLMClient):
         kw = {k: v for k, v in kw.items() if v is not None}
         try:
             chat_completion = self._client.chat.completions.create(**kw)
+            # the provider is only set again when the served model changes
+            model = None
             for chunk in chat_completion:
                 if message_content_only:
                     content = chunk.choices[0].delta.content  # type: ignore[union-attr]    # noqa: E501
                 else:
                     content = ChatCompletion(**chunk.dict())
-                self.set_provider(chunk.model.split("@")[-1])  # type: ignore[union-attr]   # noqa: E501
+                if chunk.model != model:  # type: ignore[union-attr]
+                    model = chunk.model  # type: ignore[union-attr]
+                    self.set_provider(model.split("@")[-1])
                 if content is not None:
                     yield content
         except openai.APIStatusError as e:
@@ -426,12 +490,8 @@ class Unify(_UniLLMClient):
         message_content_only: bool = True,
         cache: bool = False,
     ) -> str:
-        prompt_dict = prompt.model_dump()
-        if "extra_body" in prompt_dict:
-            extra_body = prompt_dict["extra_body"]
-            del prompt_dict["extra_body"]
-        else:
-            extra_body = {}
+        prompt_dict = prompt.model_dump(exclude_none=True, exclude={"extra_body"})
+        extra_body = prompt.extra_body or {}
         # o1-preview and o1-mini don't work properly if we pass max_completion_tokens
         # this logic hasn't been added to the stream function because o1
         # models don't work when streaming
@@ -452,17 +512,17 @@ class Unify(_UniLLMClient):
                 **extra_body,
             },
         )
-        kw = {k: v for k, v in kw.items() if v is not None}
         chat_completion = None
         if cache:
             chat_completion = _get_cache(kw)
         if chat_completion is None:
             try:
-                chat_completion = ChatCompletion(
-                    **self._client.chat.completions.create(**kw).dict()
-                )
+                chat_completion = self._client.chat.completions.create(**kw)
             except openai.APIStatusError as e:
                 raise Exception(e.message)
+            if not message_content_only:
+                # only the content is read otherwise, straight off the openai response
+                chat_completion = ChatCompletion(**chat_completion.dict())
             if cache:
                 _write_to_cache(kw, chat_completion)
         if "router" not in endpoint:
@@ -572,6 +632,14 @@ class AsyncUnify(_UniLLMClient):
     """Class for interacting with the Unify chat completions endpoint in a synchronous
     manner."""
 
+    __slots__ = ("_client_loop",)
+
+    def __init__(self, *args, **kwargs) -> None:  # noqa: DAR101
+        """Initialize the asynchronous Single LLM Unify client, see _UniLLMClient."""
+        super().__init__(*args, **kwargs)
+        # the event loop which self._client is bound to, set on first use
+        self._client_loop = None
+
     def _get_client(self):
         try:
             return openai.AsyncOpenAI(
@@ -581,6 +649,18 @@ class AsyncUnify(_UniLLMClient):
         except openai.APIStatusError as e:
             raise Exception(f"Failed to initialize Unify client: {str(e)}")
 
+    def _get_loop_client(self) -> openai.AsyncOpenAI:
+        # the connections of an async client belong to the event loop they were opened
+        # in, so they are reused within a loop but a new client is made for a new loop
+        loop = asyncio.get_running_loop()
+        if self._client_loop is not None and self._client_loop is not loop:
+            # the old client is dropped rather than closed: its connections can only
+            # be closed from their own loop, which asyncio.run has usually closed
+            # already, and its sockets are released when it is garbage collected
+            self._client = self._get_client()
+        self._client_loop = loop
+        return self._client
+
     async def _generate_stream(
         self,
         endpoint: str,
@@ -593,12 +673,8 @@ class AsyncUnify(_UniLLMClient):
         # python client arguments
         message_content_only: bool = True,
     ) -> AsyncGenerator[str, None]:
-        prompt_dict = prompt.model_dump()
-        if "extra_body" in prompt_dict:
-            extra_body = prompt_dict["extra_body"]
-            del prompt_dict["extra_body"]
-        else:
-            extra_body = {}
+        prompt_dict = prompt.model_dump(exclude_none=True, exclude={"extra_body"})
+        extra_body = prompt.extra_body or {}
         kw = dict(
             model=endpoint,
             **prompt_dict,
@@ -614,9 +690,13 @@ class AsyncUnify(_UniLLMClient):
         )
         kw = {k: v for k, v in kw.items() if v is not None}
         try:
-            async_stream = await self._client.chat.completions.create(**kw)
+            async_stream = await self._get_loop_client().chat.completions.create(**kw)
+            # the provider is only set again when the served model changes
+            model = None
             async for chunk in async_stream:  # type: ignore[union-attr]
-                self.set_provider(chunk.model.split("@")[-1])
+                if chunk.model != model:
+                    model = chunk.model
+                    self.set_provider(model.split("@")[-1])
                 if message_content_only:
                     yield chunk.choices[0].delta.content or ""
                 else:
@@ -635,12 +715,8 @@ class AsyncUnify(_UniLLMClient):
         message_content_only: bool = True,
         cache: bool = False,
     ) -> str:
-        prompt_dict = prompt.model_dump()
-        if "extra_body" in prompt_dict:
-            extra_body = prompt_dict["extra_body"]
-            del prompt_dict["extra_body"]
-        else:
-            extra_body = {}
+        prompt_dict = prompt.model_dump(exclude_none=True, exclude={"extra_body"})
+        extra_body = prompt.extra_body or {}
         kw = dict(
             model=endpoint,
             **prompt_dict,
@@ -652,25 +728,28 @@ class AsyncUnify(_UniLLMClient):
                 **extra_body,
             },
         )
-        kw = {k: v for k, v in kw.items() if v is not None}
         chat_completion = None
         if cache:
-            chat_completion = _get_cache(kw)
+            # the cache file is read and rewritten off the event loop
+            chat_completion = await asyncio.to_thread(_get_cache, kw)
         if chat_completion is None:
             try:
-                async_response = await self._client.chat.completions.create(**kw)
-                async_response = ChatCompletion(**async_response.dict())
+                client = self._get_loop_client()
+                chat_completion = await client.chat.completions.create(**kw)
             except openai.APIStatusError as e:
                 raise Exception(e.message)
+            if not message_content_only:
+                # only the content is read otherwise, straight off the openai response
+                chat_completion = ChatCompletion(**chat_completion.dict())
             if cache:
-                _write_to_cache(kw, chat_completion)
-        self.set_provider(async_response.model.split("@")[-1])  # type: ignore
+                await asyncio.to_thread(_write_to_cache, kw, chat_completion)
+        self.set_provider(chat_completion.model.split("@")[-1])  # type: ignore
         if message_content_only:
-            content = async_response.choices[0].message.content
+            content = chat_completion.choices[0].message.content
             if content:
                 return content.strip(" ")
             return ""
-        return async_response
+        return chat_completion
 
     async def _generate(  # noqa: WPS234, WPS211
         self,
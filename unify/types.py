@@ -1,5 +1,6 @@
 import abc
 import inspect
+import functools
 import rich.repr
 from io import StringIO
 from rich.console import Console
@@ -21,6 +22,26 @@ import unify
 
 RICH_CONSOLE = Console(file=StringIO())
 
+# pruned models are rebuilt on every repr, so the generated classes are cached
+# bounded, since the extra fields of each Datum give a different pruned model
+_PRUNED_MODELS_MAXSIZE = 256
+
+
+@functools.lru_cache(maxsize=_PRUNED_MODELS_MAXSIZE)
+def _cached_pruned_model(name, config_items, arbitrary_types_allowed):
+    kw = {"__cls_kwargs__": {"arbitrary_types_allowed": True}} \
+        if arbitrary_types_allowed else {}
+    return create_model(name, **dict(config_items), **kw)
+
+
+def _create_pruned_model(name, config, arbitrary_types_allowed=False):
+    args = (name, tuple(config.items()), arbitrary_types_allowed)
+    try:
+        return _cached_pruned_model(*args)
+    except TypeError:
+        # unhashable annotations or defaults, cannot be cached
+        return _cached_pruned_model.__wrapped__(*args)
+
 
 class _Formatted(abc.ABC):
 
@@ -58,7 +79,7 @@ class _FormattedBaseModel(_Formatted, BaseModel):
             name = val.__qualname__
         else:
             name = val.__class__.__name__
-        return create_model(name, **config)
+        return _create_pruned_model(name, config)
 
     @staticmethod
     def _annotation(v):
@@ -73,16 +94,17 @@ class _FormattedBaseModel(_Formatted, BaseModel):
         return None
 
     def _prune(self):
-        dct = self._prune_dict(self.dict())
+        # model fields are pruned by pydantic, free-form dict values by _prune_dict
+        dct = self._prune_dict(self.model_dump(exclude_none=True))
         fields = self.model_fields
         if self.model_extra is not None:
             fields = {**fields, **self.model_extra}
         config = {k: (self._prune_pydantic(self._annotation(fields[k]), v),
                       self._default(fields[k])) for k, v in dct.items()}
-        return create_model(
+        return _create_pruned_model(
             self.__class__.__name__,
-            **config,
-            __cls_kwargs__={"arbitrary_types_allowed": True}
+            config,
+            arbitrary_types_allowed=True,
         )(**dct)
 
     def __repr__(self) -> str:
@@ -160,12 +182,12 @@ class Prompt(_FormattedBaseModel):
 class ChatCompletion(_FormattedBaseModel, _ChatCompletion):
 
     def _chat_completion_pruned(self):
-        return create_model(
+        return _create_pruned_model(
             self.__class__.__name__,
-            choices=(self.model_fields["choices"].annotation,
-                     self.model_fields["choices"].default),
-            __cls_kwargs__={"arbitrary_types_allowed": True}
-        )(choices=self.dict()["choices"])
+            {"choices": (self.model_fields["choices"].annotation,
+                         self.model_fields["choices"].default)},
+            arbitrary_types_allowed=True,
+        )(choices=self.model_dump(include={"choices"})["choices"])
 
     def __repr__(self) -> str:
         return self._repr(self._chat_completion_pruned())
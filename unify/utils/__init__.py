@@ -0,0 +1,32 @@
+"""Utility submodules, imported on first attribute access (PEP 562)."""
+import importlib as _importlib
+
+_SUBMODULES = frozenset(
+    {
+        "credits",
+        "custom_api_keys",
+        "custom_endpoints",
+        "datasets",
+        "default_prompts",
+        "efficiency_benchmarks",
+        "evaluations",
+        "evaluators",
+        "helpers",
+        "logging",
+        "router_configurations",
+        "router_deployment",
+        "router_training",
+        "supported_endpoints",
+    },
+)
+
+
+def __getattr__(name):
+    if name not in _SUBMODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # importing a submodule also binds it on this package, so this runs once
+    return _importlib.import_module(f"{__name__}.{name}")
+
+
+def __dir__():
+    return sorted({*globals(), *_SUBMODULES})
@@ -1,8 +1,7 @@
-import requests
 from typing import Optional
 
 from unify import BASE_URL
-from .helpers import _validate_api_key, _res_to_list
+from .helpers import _validate_api_key, _res_to_list, _session
 
 
 def get_credits(api_key: Optional[str] = None) -> float:
@@ -24,7 +23,7 @@ def get_credits(api_key: Optional[str] = None) -> float:
         "Authorization": f"Bearer {api_key}",
     }
     # Send GET request to the /get_credits endpoint
-    response = requests.get(BASE_URL + "/credits", headers=headers)
+    response = _session.get(BASE_URL + "/credits", headers=headers)
     response.raise_for_status()
     return _res_to_list(response)["credits"]
 
@@ -1,8 +1,7 @@
-import requests
 from typing import Optional, List, Any, Dict
 
 from unify import BASE_URL
-from .helpers import _validate_api_key
+from .helpers import _validate_api_key, _session
 
 
 def create_custom_api_key(
@@ -30,7 +29,7 @@ def create_custom_api_key(
 
     params = {"name": name, "value": value}
 
-    response = requests.post(url, headers=headers, params=params)
+    response = _session.post(url, headers=headers, params=params)
     response.raise_for_status()
 
     return response.json()
@@ -59,7 +58,7 @@ def get_custom_api_key(name: str, api_key: Optional[str] = None) -> Dict[str, An
     url = f"{BASE_URL}/custom_api_key"
     params = {"name": name}
 
-    response = requests.get(url, headers=headers, params=params)
+    response = _session.get(url, headers=headers, params=params)
     response.raise_for_status()
 
     return response.json()
@@ -90,7 +89,7 @@ def delete_custom_api_key(name: str, api_key: Optional[str] = None) -> Dict[str,
 
     params = {"name": name}
 
-    response = requests.delete(url, headers=headers, params=params)
+    response = _session.delete(url, headers=headers, params=params)
 
     if response.status_code == 200:
         return response.json()
@@ -128,7 +127,7 @@ def rename_custom_api_key(
 
     params = {"name": name, "new_name": new_name}
 
-    response = requests.post(url, headers=headers, params=params)
+    response = _session.post(url, headers=headers, params=params)
     response.raise_for_status()
 
     return response.json()
@@ -154,7 +153,7 @@ def list_custom_api_keys(api_key: Optional[str] = None) -> List[Dict[str, str]]:
     }
     url = f"{BASE_URL}/custom_api_key/list"
 
-    response = requests.get(url, headers=headers)
+    response = _session.get(url, headers=headers)
     response.raise_for_status()
 
     return response.json()
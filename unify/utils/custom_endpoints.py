@@ -1,8 +1,7 @@
-import requests
 from typing import Optional, List, Any, Dict
 
 from unify import BASE_URL
-from .helpers import _validate_api_key
+from .helpers import _validate_api_key, _session
 
 
 def create_custom_endpoint(
@@ -49,7 +48,7 @@ def create_custom_endpoint(
     if provider:
         params["provider"] = provider
 
-    response = requests.post(
+    response = _session.post(
         f"{BASE_URL}/custom_endpoint", headers=headers, params=params
     )
     response.raise_for_status()
@@ -81,7 +80,7 @@ def delete_custom_endpoint(name: str, api_key: Optional[str] = None) -> Dict[str
 
     params = {"name": name}
 
-    response = requests.delete(url, headers=headers, params=params)
+    response = _session.delete(url, headers=headers, params=params)
     response.raise_for_status()
 
     return response.json()
@@ -114,7 +113,7 @@ def rename_custom_endpoint(
 
     params = {"name": name, "new_name": new_name}
 
-    response = requests.post(url, headers=headers, params=params)
+    response = _session.post(url, headers=headers, params=params)
     response.raise_for_status()
 
     return response.json()
@@ -142,7 +141,7 @@ def list_custom_endpoints(api_key: Optional[str] = None) -> List[Dict[str, str]]
     }
     url = f"{BASE_URL}/custom_endpoint/list"
 
-    response = requests.get(url, headers=headers)
+    response = _session.get(url, headers=headers)
     response.raise_for_status()
 
     return response.json()
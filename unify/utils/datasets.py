@@ -1,10 +1,9 @@
 import json
-import requests
 from typing import List, Dict, Optional, Union
 
 from unify import BASE_URL
 from unify.types import Datum
-from .helpers import _validate_api_key, _res_to_list
+from .helpers import _validate_api_key, _res_to_list, _session
 
 
 def _upload_dataset_from_str(
@@ -18,7 +17,7 @@ def _upload_dataset_from_str(
     files = {"file": ("dataset", content, "application/x-jsonlines")}
     data = {"name": name}
     # Send POST request to the /dataset endpoint
-    response = requests.post(
+    response = _session.post(
         BASE_URL + "/dataset", headers=headers, data=data, files=files
     )
     response.raise_for_status()
@@ -98,7 +97,7 @@ def download_dataset(
     }
     params = {"name": name}
     # Send GET request to the /dataset endpoint
-    response = requests.get(BASE_URL + "/dataset", headers=headers, params=params)
+    response = _session.get(BASE_URL + "/dataset", headers=headers, params=params)
     response.raise_for_status()
     if path:
         with open(path, "w+") as f:
@@ -133,7 +132,7 @@ def delete_dataset(name: str, api_key: Optional[str] = None) -> str:
     }
     params = {"name": name}
     # Send DELETE request to the /dataset endpoint
-    response = requests.delete(BASE_URL + "/dataset", headers=headers, params=params)
+    response = _session.delete(BASE_URL + "/dataset", headers=headers, params=params)
     response.raise_for_status()
     return json.loads(response.text)["info"]
 
@@ -148,7 +147,7 @@ def rename_dataset(name: str, new_name: str, api_key: Optional[str] = None):
         "Authorization": f"Bearer {api_key}",
     }
     params = {"name": name, "new_name": new_name}
-    response = requests.post(
+    response = _session.post(
         BASE_URL + "/dataset/rename", headers=headers, params=params
     )
     response.raise_for_status()
@@ -174,7 +173,7 @@ def list_datasets(api_key: Optional[str] = None) -> List[str]:
         "Authorization": f"Bearer {api_key}",
     }
     # Send GET request to the /dataset/list endpoint
-    response = requests.get(BASE_URL + "/dataset/list", headers=headers)
+    response = _session.get(BASE_URL + "/dataset/list", headers=headers)
     response.raise_for_status()
     return _res_to_list(response)
 
@@ -193,7 +192,7 @@ def add_data(
         "Authorization": f"Bearer {api_key}",
     }
     body = {"name": name, "data": data}
-    response = requests.post(
+    response = _session.post(
         BASE_URL + "/dataset/data", headers=headers, json=body
     )
     response.raise_for_status()
@@ -230,7 +229,7 @@ def delete_data(
     else:
         data_ids = data
     params = {"name": name, "data_ids": data_ids}
-    response = requests.delete(
+    response = _session.delete(
         BASE_URL + "/dataset/data", headers=headers, params=params
     )
     response.raise_for_status()
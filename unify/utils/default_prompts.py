@@ -1,8 +1,7 @@
-import requests
 from typing import Optional, Any, Dict
 
 from unify import BASE_URL
-from .helpers import _validate_api_key
+from .helpers import _validate_api_key, _session
 
 
 def create_default_prompt(name: str, prompt: dict, api_key: Optional[str] = None):
@@ -19,7 +18,7 @@ def create_default_prompt(name: str, prompt: dict, api_key: Optional[str] = None
         "prompt": prompt,
     }
 
-    response = requests.post(url, headers=headers, json=params)
+    response = _session.post(url, headers=headers, json=params)
     response.raise_for_status()
 
     return response.json()
@@ -38,7 +37,7 @@ def get_default_prompt(name: str, api_key: Optional[str] = None):
         "name": name,
     }
 
-    response = requests.get(url, headers=headers, params=params)
+    response = _session.get(url, headers=headers, params=params)
     response.raise_for_status()
 
     return response.json()
@@ -57,7 +56,7 @@ def delete_default_prompt(name: str, api_key: Optional[str] = None):
         "name": name,
     }
 
-    response = requests.delete(url, headers=headers, params=params)
+    response = _session.delete(url, headers=headers, params=params)
     response.raise_for_status()
 
     return response.json()
@@ -77,7 +76,7 @@ def rename_default_prompt(name: str, new_name: str, api_key: Optional[str] = Non
         "new_name": new_name,
     }
 
-    response = requests.post(url, headers=headers, params=params)
+    response = _session.post(url, headers=headers, params=params)
     response.raise_for_status()
 
     return response.json()
@@ -92,7 +91,7 @@ def list_default_prompts(api_key: Optional[str] = None):
 
     url = f"{BASE_URL}/default_prompt/list"
 
-    response = requests.get(url, headers=headers)
+    response = _session.get(url, headers=headers)
     response.raise_for_status()
 
     return response.json()
@@ -1,9 +1,8 @@
 import os
-import requests
 from typing import Optional, Any, Dict
 
 from unify import BASE_URL
-from .helpers import _validate_api_key
+from .helpers import _validate_api_key, _session
 
 
 def trigger_evaluation(
@@ -56,7 +55,7 @@ def trigger_evaluation(
             "application/json",
         )
 
-    response = requests.post(url, headers=headers, params=params, files=files)
+    response = _session.post(url, headers=headers, params=params, files=files)
     response.raise_for_status()
 
     return response.json()
@@ -98,7 +97,7 @@ def get_evaluations(
     if evaluator:
         params["evaluator"] = evaluator
 
-    response = requests.get(url, headers=headers, params=params)
+    response = _session.get(url, headers=headers, params=params)
     response.raise_for_status()
 
     return response.json()
@@ -142,7 +141,7 @@ def delete_evaluations(
     if evaluator:
         params["evaluator"] = evaluator
 
-    response = requests.delete(url, headers=headers, params=params)
+    response = _session.delete(url, headers=headers, params=params)
     response.raise_for_status()
 
     return response.json()
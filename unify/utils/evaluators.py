@@ -1,8 +1,7 @@
-import requests
 from typing import Optional, List, Any, Dict
 
 from unify import BASE_URL
-from .helpers import _validate_api_key
+from .helpers import _validate_api_key, _session
 
 
 def create_evaluator(
@@ -28,7 +27,7 @@ def create_evaluator(
     }
     url = f"{BASE_URL}/evaluator"
 
-    response = requests.post(url, headers=headers, json=evaluator_config)
+    response = _session.post(url, headers=headers, json=evaluator_config)
     response.raise_for_status()
 
     return response.json()
@@ -58,7 +57,7 @@ def get_evaluator(name: str, api_key: Optional[str] = None) -> Dict[str, Any]:
 
     params = {"name": name}
 
-    response = requests.get(url, headers=headers, params=params)
+    response = _session.get(url, headers=headers, params=params)
     response.raise_for_status()
 
     return response.json()
@@ -88,7 +87,7 @@ def delete_evaluator(name: str, api_key: Optional[str] = None) -> Dict[str, str]
 
     params = {"name": name}
 
-    response = requests.delete(url, headers=headers, params=params)
+    response = _session.delete(url, headers=headers, params=params)
     response.raise_for_status()
 
     return response.json()
@@ -121,7 +120,7 @@ def rename_evaluator(
 
     params = {"name": name, "new_name": new_name}
 
-    response = requests.post(url, headers=headers, params=params)
+    response = _session.post(url, headers=headers, params=params)
     response.raise_for_status()
 
     return response.json()
@@ -144,7 +143,7 @@ def list_evaluators(api_key: Optional[str] = None) -> List[str]:
         "Authorization": f"Bearer {api_key}",
     }
     url = f"{BASE_URL}/evaluator/list"
-    response = requests.get(url, headers=headers)
+    response = _session.get(url, headers=headers)
     response.raise_for_status()
 
     return response.json()
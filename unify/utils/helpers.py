@@ -1,9 +1,26 @@
 import os
 import json
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pydantic import BaseModel, ValidationError
 from typing import List, Dict, Optional, Union, Any
 
+# shared across the REST helpers, so consecutive calls reuse open connections
+_session = requests.Session()
+# reads are retried on transient gateway errors, with backoff, and the last response
+# is returned as is so that raise_for_status still reports it. Writes and deletes are
+# never resent, since the first attempt may already have been applied
+_retries = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=(502, 503, 504),
+    allowed_methods=frozenset({"GET", "HEAD", "OPTIONS"}),
+    raise_on_status=False,
+)
+_session.mount("https://", HTTPAdapter(max_retries=_retries))
+_session.mount("http://", HTTPAdapter(max_retries=_retries))
+
 
 def _res_to_list(response: requests.Response) -> Union[List, Dict]:
     return json.loads(response.text)
@@ -19,8 +36,10 @@ def _validate_api_key(api_key: Optional[str]) -> str:
     return api_key
 
 
-def _default(value: Any, default_value: Any) -> Any:
-    return value if value is not None else default_value
+def _default(value: Any, default_value: Any, fallback: Any = None) -> Any:
+    if value is not None:
+        return value
+    return default_value if default_value is not None else fallback
 
 
 def _dict_aligns_with_pydantic(dict_in: Dict, pydantic_cls: type(BaseModel)) -> bool:
@@ -1,9 +1,8 @@
-import requests
 import datetime
 from typing import Optional, List, Any, Dict, Union
 
 from unify import BASE_URL
-from .helpers import _validate_api_key
+from .helpers import _validate_api_key, _session
 
 
 def get_query_tags(api_key: Optional[str] = None) -> List[str]:
@@ -23,7 +22,7 @@ def get_query_tags(api_key: Optional[str] = None) -> List[str]:
         "Authorization": f"Bearer {api_key}",
     }
     url = f"{BASE_URL}/tags"
-    response = requests.get(url, headers=headers)
+    response = _session.get(url, headers=headers)
     response.raise_for_status()
 
     return response.json()
@@ -66,7 +65,7 @@ def get_queries(
         params["end_time"] = end_time
 
     url = f"{BASE_URL}/queries"
-    response = requests.get(url, headers=headers, params=params)
+    response = _session.get(url, headers=headers, params=params)
     response.raise_for_status()
 
     return response.json()
@@ -118,7 +117,7 @@ def log_query(
 
     url = f"{BASE_URL}/queries"
 
-    response = requests.post(url, headers=headers, json=data)
+    response = _session.post(url, headers=headers, json=data)
     response.raise_for_status()
 
     return response.json()
@@ -168,7 +167,7 @@ def get_query_metrics(
 
     url = f"{BASE_URL}/metrics"
 
-    response = requests.get(url, headers=headers, params=params)
+    response = _session.get(url, headers=headers, params=params)
     response.raise_for_status()
 
     return response.json()
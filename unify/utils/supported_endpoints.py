@@ -1,8 +1,7 @@
-import requests
 from typing import List, Optional
 
 from unify import BASE_URL
-from .helpers import _validate_api_key, _res_to_list
+from .helpers import _validate_api_key, _res_to_list, _session
 
 
 def list_providers(
@@ -33,7 +32,7 @@ def list_providers(
         kw = dict(headers=headers, params={"model": model})
     else:
         kw = dict(headers=headers)
-    response = requests.get(url, **kw)
+    response = _session.get(url, **kw)
     response.raise_for_status()
     return _res_to_list(response)
 
@@ -65,7 +64,7 @@ def list_models(
         kw = dict(headers=headers, params={"provider": provider})
     else:
         kw = dict(headers=headers)
-    response = requests.get(url, **kw)
+    response = _session.get(url, **kw)
     response.raise_for_status()
     return _res_to_list(response)
 
@@ -102,11 +101,11 @@ def list_endpoints(
         raise ValueError("Please specify either model OR provider, not both.")
     elif model:
         kw = dict(headers=headers, params={"model": model})
-        return _res_to_list(requests.get(url, headers=headers, params={"model": model}))
+        return _res_to_list(_session.get(url, headers=headers, params={"model": model}))
     elif provider:
         kw = dict(headers=headers, params={"provider": provider})
     else:
         kw = dict(headers=headers)
-    response = requests.get(url, **kw)
+    response = _session.get(url, **kw)
     response.raise_for_status()
     return _res_to_list(response)